@@ -1,5 +1,8 @@
+import io
 import platform
+import shutil
 import subprocess
+import threading
 from typing import Optional, Tuple, Union
 
 import numpy as np
@@ -40,6 +43,83 @@ def ffmpeg_read(bpayload: bytes, sampling_rate: int) -> np.array:
     return audio
 
 
+def ffmpeg_read_streaming(stream, sampling_rate: int) -> np.array:
+    """
+    Helper function to read an audio stream (an open file or any file-like object) through ffmpeg, without buffering
+    the whole compressed payload in memory first.
+    """
+    ar = f"{sampling_rate}"
+    ac = "1"
+    format_for_conversion = "f32le"
+    ffmpeg_command = [
+        "ffmpeg",
+        "-i",
+        "pipe:0",
+        "-ac",
+        ac,
+        "-ar",
+        ar,
+        "-f",
+        format_for_conversion,
+        "-hide_banner",
+        "-loglevel",
+        "quiet",
+        "pipe:1",
+    ]
+
+    try:
+        # Real files can be handed to ffmpeg directly, anything else (HTTP
+        # responses for instance) is fed through a pipe in a background thread.
+        stream.fileno()
+        stdin = stream
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        stdin = subprocess.PIPE
+
+    try:
+        ffmpeg_process = subprocess.Popen(ffmpeg_command, stdin=stdin, stdout=subprocess.PIPE, bufsize=0)
+    except FileNotFoundError as error:
+        raise ValueError("ffmpeg was not found but is required to load audio files from filename") from error
+
+    feeder = None
+    if stdin is subprocess.PIPE:
+
+        def _feed():
+            try:
+                shutil.copyfileobj(stream, ffmpeg_process.stdin)
+            except BrokenPipeError:
+                # ffmpeg closed its input early (e.g. on malformed data)
+                pass
+            finally:
+                ffmpeg_process.stdin.close()
+
+        feeder = threading.Thread(target=_feed, daemon=True)
+        feeder.start()
+
+    # Decoded samples are read straight into a preallocated float32 buffer
+    # (grown by doubling), avoiding the bytes -> np.frombuffer copy.
+    audio = np.empty(max(sampling_rate, 16384), dtype=np.float32)
+    buffer = memoryview(audio).cast("B")
+    pos = 0
+    while True:
+        read = ffmpeg_process.stdout.readinto(buffer[pos:])
+        if not read:
+            break
+        pos += read
+        if pos == len(buffer):
+            grown = np.empty(2 * audio.shape[0], dtype=np.float32)
+            grown[: audio.shape[0]] = audio
+            audio = grown
+            buffer = memoryview(audio).cast("B")
+    ffmpeg_process.wait()
+    if feeder is not None:
+        feeder.join()
+
+    audio = audio[: pos // 4]
+    if audio.shape[0] == 0:
+        raise ValueError("Malformed soundfile")
+    return audio
+
+
 def ffmpeg_microphone(
     sampling_rate: int,
     chunk_length_s: float,
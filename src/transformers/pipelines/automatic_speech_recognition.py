@@ -11,6 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import multiprocessing
+import os
+import queue
+import threading
 from collections import defaultdict
 from typing import TYPE_CHECKING, Dict, Optional, Union
 
@@ -18,8 +22,8 @@ import numpy as np
 
 import requests
 
-from ..utils import is_torch_available, logging
-from .audio_utils import ffmpeg_read
+from ..utils import is_numba_available, is_torch_available, logging
+from .audio_utils import ffmpeg_read, ffmpeg_read_streaming
 from .base import ChunkPipeline
 
 
@@ -31,8 +35,44 @@ if TYPE_CHECKING:
 logger = logging.get_logger(__name__)
 
 if is_torch_available():
+    import torch
+
     from ..models.auto.modeling_auto import MODEL_FOR_CTC_MAPPING, MODEL_FOR_SPEECH_SEQ_2_SEQ_MAPPING
 
+_lcs_overlap_index = None
+
+
+def _get_lcs_overlap_index():
+    # numba takes seconds to import, so it is only pulled in (and the kernel
+    # compiled, `cache=True` makes that a one-off per machine) on the first
+    # merge of chunked seq2seq outputs, not when the pipelines are imported.
+    global _lcs_overlap_index
+    if _lcs_overlap_index is None:
+        import numba
+
+        @numba.njit(cache=True)
+        def _overlap_index(left, right):
+            # JIT-compiled equivalent of the NumPy overlap search below: fuses
+            # the equality, match counting and best-score tracking in one loop
+            # with no O(n^2) temporaries, which wins on very long sequences.
+            n = left.shape[0]
+            index = 0
+            max_ = 0.0
+            for i in range(1, n + 1):
+                matches = 0
+                for k in range(i):
+                    if left[n - i + k] == right[k]:
+                        matches += 1
+                # epsilon to favor long perfect matches
+                matching = matches / i + i / 10000.0
+                if matches > 1 and matching > max_:
+                    index = i
+                    max_ = matching
+            return index
+
+        _lcs_overlap_index = _overlap_index
+    return _lcs_overlap_index
+
 
 def rescale_stride(stride, ratio):
     """
@@ -43,6 +83,18 @@ def rescale_stride(stride, ratio):
     # Shape is [B, SEQ] for tokens
     # [B, SEQ, V] for logits
 
+    if len(stride) > 8:
+        # Larger batches of strides are rescaled in a single vectorized pass,
+        # the scalar loop below is kept for the common single-tuple case where
+        # the array round-trip would cost more than it saves.
+        arr = np.asarray(stride, dtype=np.float64)
+        input_n = arr[:, 0]
+        token_n = np.rint(input_n * ratio)
+        left = np.rint(arr[:, 1] / input_n * token_n).astype(np.int64)
+        right = np.rint(arr[:, 2] / input_n * token_n).astype(np.int64)
+        token_n = token_n.astype(np.int64)
+        return [(int(t), int(l), int(r)) for t, l, r in zip(token_n, left, right)]
+
     new_strides = []
     for input_n, left, right in stride:
         token_n = int(round(input_n * ratio))
@@ -54,55 +106,208 @@ def rescale_stride(stride, ratio):
     return new_strides
 
 
-def chunk_iter(inputs, feature_extractor, chunk_len, stride_left, stride_right, dtype=None):
+def chunk_iter(inputs, feature_extractor, chunk_len, stride_left, stride_right, dtype=None, pin_memory=False):
     inputs_len = inputs.shape[0]
     step = chunk_len - stride_left - stride_right
-    for i in range(0, inputs_len, step):
+    starts = list(range(0, inputs_len, step))
+    # The full-length chunks are extracted in small batched groups, which
+    # amortizes the feature extraction over one vectorized transform per group
+    # instead of one Python call per chunk, while keeping peak memory and the
+    # time to the first yielded chunk proportional to a group rather than to
+    # the whole audio. The trailing chunks are shorter (and of different
+    # lengths), they keep going through the extractor one by one so that
+    # per-sequence operations such as normalization are unchanged.
+    group_size = 8
+    num_full = sum(1 for start in starts if start + chunk_len <= inputs_len)
+    batch = None
+    batch_offset = 0
+    batch_len = 0
+    for index, start in enumerate(starts):
         # add start and end paddings to the chunk
-        chunk = inputs[i : i + chunk_len]
-        processed = feature_extractor(chunk, sampling_rate=feature_extractor.sampling_rate, return_tensors="pt")
-        if dtype is not None:
-            processed = processed.to(dtype=dtype)
-        _stride_left = 0 if i == 0 else stride_left
-        is_last = i + step + stride_left >= inputs_len
+        chunk = inputs[start : start + chunk_len]
+        if num_full > 1 and index < num_full:
+            if index >= batch_offset + batch_len:
+                batch_offset = index
+                group = [
+                    np.asarray(inputs[s : s + chunk_len]) for s in starts[index : min(index + group_size, num_full)]
+                ]
+                batch_len = len(group)
+                batch = feature_extractor(group, sampling_rate=feature_extractor.sampling_rate, return_tensors="pt")
+                if dtype is not None:
+                    batch = batch.to(dtype=dtype)
+                if pin_memory:
+                    # Pinned host memory allows `Pipeline.forward` to copy the
+                    # chunk to the GPU asynchronously, overlapping with compute.
+                    for k, v in batch.items():
+                        if isinstance(v, torch.Tensor):
+                            batch[k] = v.pin_memory()
+            processed = {k: v[index - batch_offset : index - batch_offset + 1] for k, v in batch.items()}
+        else:
+            processed = feature_extractor(chunk, sampling_rate=feature_extractor.sampling_rate, return_tensors="pt")
+            if dtype is not None:
+                processed = processed.to(dtype=dtype)
+        _stride_left = 0 if start == 0 else stride_left
+        is_last = start + step + stride_left >= inputs_len
         _stride_right = 0 if is_last else stride_right
 
         if "input_features" in processed:
             processed_len = processed["input_features"].shape[-1]
         elif "input_values" in processed:
             processed_len = processed["input_values"].shape[-1]
-        chunk_len = chunk.shape[0]
-        stride = (chunk_len, _stride_left, _stride_right)
+        chunk_size = chunk.shape[0]
+        stride = (chunk_size, _stride_left, _stride_right)
         if processed_len != chunk.shape[-1]:
-            ratio = processed_len / chunk_len
-            stride = rescale_stride([stride], ratio)[0]
+            # `round(chunk_size * processed_len / chunk_size)` is exactly
+            # `processed_len`, and when the strides divide evenly (the usual
+            # case, `preprocess` aligns them on the model ratio) the whole
+            # rescale is exact integer math, with no float rounding per chunk.
+            left_scaled, left_rest = divmod(_stride_left * processed_len, chunk_size)
+            right_scaled, right_rest = divmod(_stride_right * processed_len, chunk_size)
+            if left_rest == 0 and right_rest == 0:
+                stride = (processed_len, left_scaled, right_scaled)
+            else:
+                ratio = processed_len / chunk_size
+                stride = rescale_stride([stride], ratio)[0]
         if chunk.shape[0] > _stride_left:
             yield {"is_last": is_last, "stride": stride, **processed}
 
 
-def _find_longest_common_sequence(sequences, tokenizer):
+def _prefetch_iterator(iterator, num_prefetch=2):
+    """
+    Consumes `iterator` in a background thread so that the next item is being prepared (e.g. features extracted for
+    the next chunk) while the caller is busy with the current one (e.g. running the model forward).
+    """
+    buffer = queue.Queue(maxsize=num_prefetch)
+    sentinel = object()
+
+    def _produce():
+        try:
+            for item in iterator:
+                buffer.put(item)
+            buffer.put(sentinel)
+        except Exception as error:
+            buffer.put(error)
+
+    thread = threading.Thread(target=_produce, daemon=True)
+    thread.start()
+    while True:
+        item = buffer.get()
+        if item is sentinel:
+            break
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+def _lcs_scratch(buffers, name, shape, dtype):
+    """
+    Returns a scratch array of `shape` taken from the `buffers` cache, grown by doubling when too small, or a fresh
+    allocation when no cache is provided.
+    """
+    if buffers is None:
+        return np.empty(shape, dtype=dtype)
+    buf = buffers.get(name)
+    if buf is None or buf.dtype != dtype:
+        buf = np.empty(shape, dtype=dtype)
+        buffers[name] = buf
+    elif any(have < need for have, need in zip(buf.shape, shape)):
+        buf = np.empty(tuple(max(need, 2 * have) for have, need in zip(buf.shape, shape)), dtype=dtype)
+        buffers[name] = buf
+    return buf[tuple(slice(0, need) for need in shape)]
+
+
+def _find_longest_common_sequence(sequences, tokenizer, all_special_ids=None, buffers=None, strides=None):
     # TODO  Use a faster algorithm this can probably be done in O(n)
     # using suffix array.
     # It might be tedious to do because of fault tolerance.
     # We actually have a really good property which is that the total sequence
     # MUST be those subsequences in order.
     # Also the algorithm should be more tolerant to errors.
-    sequence = [tok_id for tok_id in sequences[0][0].tolist() if tok_id not in tokenizer.all_special_ids]
-    for new_seq in sequences[1:]:
-        new_sequence = [tok_id for tok_id in new_seq[0].tolist() if tok_id not in tokenizer.all_special_ids]
-
+    # Special tokens are dropped with a boolean lookup table and fancy
+    # indexing, a Python-level membership test per token is
+    # O(len(sequence) * len(special_ids)) on long outputs.
+    if all_special_ids is None:
+        # some tokenizers rebuild this list on every access
+        all_special_ids = np.asarray(tokenizer.all_special_ids, dtype=np.int64)
+    max_token = int(all_special_ids.max()) if all_special_ids.size else 0
+    for seq in sequences:
+        arr = np.asarray(seq[0])
+        if arr.size:
+            max_token = max(max_token, int(arr.max()))
+    special_mask = np.zeros(max_token + 1, dtype=bool)
+    special_mask[all_special_ids] = True
+
+    if strides is None:
+        strides = [None] * len(sequences)
+
+    first = np.asarray(sequences[0][0])
+    sequence = first[~special_mask[first]]
+    for new_seq, stride in zip(sequences[1:], strides[1:]):
+        new_arr = np.asarray(new_seq[0])
+        new_sequence = new_arr[~special_mask[new_arr]]
+
+        # An overlap longer than either sequence can never match, the search
+        # space is bounded by the shorter of the two.
+        max_overlap = len(new_sequence)
+        if stride is not None:
+            chunk_len, stride_left, stride_right = stride
+            if chunk_len > 0 and (stride_left or stride_right):
+                # The real overlap between consecutive chunks is bounded by the
+                # strides: estimate its token count from the audio fraction,
+                # with a 2x safety margin and a floor of 64 tokens.
+                overlap_tokens = -(-len(new_sequence) * (stride_left + stride_right) // chunk_len)
+                max_overlap = max(64, 2 * overlap_tokens)
+        n = min(len(sequence), len(new_sequence), max_overlap)
         index = 0
-        max_ = 0.0
-        for i in range(1, len(new_sequence) + 1):
+        if n > 0 and is_numba_available():
+            left = np.ascontiguousarray(sequence[-n:])
+            right = np.ascontiguousarray(new_sequence[:n])
+            index = int(_get_lcs_overlap_index()(left, right))
+        elif n > 0:
+            left = sequence[-n:]
+            right = new_sequence[:n]
+            # Score every candidate overlap length in one vectorized pass: row
+            # `j` of `windows` is `left[j:]` padded with a sentinel that can
+            # never match a token id, so comparing row `j` against `right`
+            # counts the matches for an overlap of length `n - j`.
+            padded = _lcs_scratch(buffers, "padded", (2 * n,), left.dtype)
+            padded[:n] = left
+            padded[n:] = -1
+            (itemsize,) = padded.strides
+            # The equality matrix is O(n^2), so the rows are scored in blocks
+            # of a few MB each: peak memory stays bounded no matter how long
+            # the merged transcript gets.
+            block = max(1, (1 << 22) // n)
+            counts = _lcs_scratch(buffers, "matches", (n,), np.int64)
+            eq = _lcs_scratch(buffers, "eq", (min(block, n), n), np.bool_)
+            for row in range(0, n, block):
+                rows = min(block, n - row)
+                windows = np.lib.stride_tricks.as_strided(padded[row:], shape=(rows, n), strides=(itemsize, itemsize))
+                np.equal(windows, right, out=eq[:rows])
+                np.sum(eq[:rows], axis=1, out=counts[row : row + rows])
+            # matches[i - 1] is the number of matching tokens for an overlap of length `i`
+            matches = counts[::-1]
+            lengths = buffers.get("lengths") if buffers is not None else None
+            if lengths is None or lengths.shape[0] < n:
+                lengths = np.arange(1, max(n, 2 * lengths.shape[0] if lengths is not None else 0) + 1)
+                if buffers is not None:
+                    buffers["lengths"] = lengths
+            lengths = lengths[:n]
             # epsilon to favor long perfect matches
-            eps = i / 10000.0
-            matches = np.sum(np.array(sequence[-i:]) == np.array(new_sequence[:i]))
-            matching = matches / i + eps
-            if matches > 1 and matching > max_:
-                index = i
-                max_ = matching
-        sequence.extend(new_sequence[index:])
-    return np.array(sequence)
+            matching = _lcs_scratch(buffers, "matching", (n,), np.float64)
+            np.divide(matches, lengths, out=matching)
+            eps = _lcs_scratch(buffers, "eps", (n,), np.float64)
+            np.divide(lengths, 10000.0, out=eps)
+            matching += eps
+            valid = np.greater(matches, 1, out=_lcs_scratch(buffers, "valid", (n,), np.bool_))
+            if valid.any():
+                # `argmax` returns the first occurrence, like the strict
+                # comparison of the previous implementation did
+                np.logical_not(valid, out=valid)
+                matching[valid] = -np.inf
+                index = int(np.argmax(matching)) + 1
+        sequence = np.concatenate((sequence, new_sequence[index:]))
+    return sequence
 
 
 class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
@@ -156,6 +361,10 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
 
             </Tip>
 
+        preprocess_prefetch (`bool`, *optional*, defaults to `False`):
+            Whether to extract the features of the next chunk in a background thread while the model is running on the
+            current one. Only used with `chunk_length_s > 0`, where feature extraction and the model forward can
+            overlap instead of running back to back.
         framework (`str`, *optional*):
             The framework to use, either `"pt"` for PyTorch or `"tf"` for TensorFlow. The specified framework must be
             installed. If no framework is specified, will default to the one currently installed. If no framework is
@@ -180,6 +389,22 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
     ):
         super().__init__(**kwargs)
         self.feature_extractor = feature_extractor
+        # Cached `torchaudio.transforms.Resample` instances, keyed by
+        # (orig_freq, new_freq), so the sinc kernel is only built once.
+        self._resamplers = {}
+        # `all_special_ids` is rebuilt on every access by some tokenizers,
+        # cache it once for the sequence merging of chunked seq2seq outputs.
+        if self.tokenizer is not None:
+            self._all_special_ids = np.asarray(self.tokenizer.all_special_ids, dtype=np.int64)
+        else:
+            self._all_special_ids = None
+        # Worker pool for parallel LM beam search decoding, created lazily on
+        # the first multi-chunk `ctc_with_lm` postprocess requesting it.
+        self._decode_pool = None
+        self._decode_pool_size = None
+        # Scratch arrays reused across sequence merges (batch transcriptions
+        # call `_find_longest_common_sequence` once per file).
+        self._lcs_buffers = {}
 
         if self.model.__class__ in MODEL_FOR_SPEECH_SEQ_2_SEQ_MAPPING.values():
             self.type = "seq2seq"
@@ -220,7 +445,9 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
                       pipeline do the resampling. The dict must be in the format `{"sampling_rate": int, "raw":
                       np.array}` with optionally a `"stride": (left: int, right: int)` than can ask the pipeline to
                       treat the first `left` samples and last `right` samples to be ignored in decoding (but used at
-                      inference to provide more context to the model). Only use `stride` with CTC models.
+                      inference to provide more context to the model). Only use `stride` with CTC models. Resampling
+                      is done in float32, so `np.float64` raw audio is downcast when `sampling_rate` differs from the
+                      model's.
             return_timestamps (*optional*, `str`):
                 Only available for pure CTC models. If set to `"char"`, the pipeline will return `timestamps` along the
                 text for every character in the text. For instance if you get `[{"text": "h", "timestamps": (0.5,0.6),
@@ -229,6 +456,19 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
                 `timestamps` along the text for every word in the text. For instance if you get `[{"text": "hi ",
                 "timestamps": (0.5,0.9), {"text": "there", "timestamps": (1.0, .1.5)}]`, then it means the model
                 predicts that the word "hi" was pronounced after `0.5` and before `0.9` seconds.
+            stream (`bool`, *optional*, defaults to `False`):
+                Only available for pure CTC models, when transcribing a single audio. If set to `True`, the pipeline
+                returns a generator instead of a dict: it yields `{"partial_text": str}` with the transcription so far
+                as soon as each chunk has been transcribed, and finally the usual result dict. Useful with
+                `chunk_length_s` on long audio to display partial transcriptions without waiting for the whole file.
+                The partials are decoded chunk by chunk and can differ slightly from the final text around chunk
+                boundaries.
+            num_decode_workers (`int`, *optional*):
+                Only available for CTC models with a language model head on chunked audio. When set to more than 1,
+                the LM beam search decodes the chunks in parallel in a pool of that many worker processes. Each chunk
+                is then decoded independently: the language model cannot see across chunk boundaries and a word
+                straddling one may be split, so the transcription can differ slightly from the default single-pass
+                decoding.
             generate_kwargs (`dict`, *optional*):
                 The dictionary of ad-hoc parametrization of `generate_config` to be used for the generation call. For a
                 complete overview of generate, check the [following
@@ -252,10 +492,13 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
         chunk_length_s=None,
         stride_length_s=None,
         ignore_warning=None,
+        preprocess_prefetch=None,
         decoder_kwargs=None,
         return_timestamps=None,
         generate_kwargs=None,
         max_new_tokens=None,
+        stream=None,
+        num_decode_workers=None,
     ):
         # No parameters on this pipeline right now
         preprocess_params = {}
@@ -265,6 +508,8 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
             preprocess_params["stride_length_s"] = stride_length_s
         if ignore_warning is not None:
             preprocess_params["ignore_warning"] = ignore_warning
+        if preprocess_prefetch is not None:
+            preprocess_params["preprocess_prefetch"] = preprocess_prefetch
 
         forward_params = {"generate_kwargs": {}}
         if max_new_tokens is not None:
@@ -282,18 +527,45 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
             postprocess_params["decoder_kwargs"] = decoder_kwargs
         if return_timestamps is not None:
             postprocess_params["return_timestamps"] = return_timestamps
+        if stream is not None:
+            postprocess_params["stream"] = stream
+        if num_decode_workers is not None:
+            postprocess_params["num_decode_workers"] = num_decode_workers
 
         return preprocess_params, forward_params, postprocess_params
 
-    def preprocess(self, inputs, chunk_length_s=0, stride_length_s=None, ignore_warning=False):
+    def run_single(self, inputs, preprocess_params, forward_params, postprocess_params):
+        if postprocess_params.get("stream"):
+            if self.type != "ctc":
+                raise ValueError("`stream=True` is only available with pure CTC models")
+            # `ChunkPipeline.run_single` collects every forward output before
+            # calling `postprocess`, which would delay the first partial
+            # transcription until the whole audio is transcribed. Streaming
+            # instead forwards the chunks lazily, one per yielded partial.
+            model_outputs = (
+                self.forward(model_inputs, **forward_params)
+                for model_inputs in self.preprocess(inputs, **preprocess_params)
+            )
+            return self._postprocess_stream(model_outputs, postprocess_params.get("return_timestamps"))
+        return super().run_single(inputs, preprocess_params, forward_params, postprocess_params)
+
+    def preprocess(
+        self, inputs, chunk_length_s=0, stride_length_s=None, ignore_warning=False, preprocess_prefetch=False
+    ):
         if isinstance(inputs, str):
+            # The compressed payload is streamed straight into ffmpeg instead
+            # of being buffered in memory first.
             if inputs.startswith("http://") or inputs.startswith("https://"):
                 # We need to actually check for a real protocol, otherwise it's impossible to use a local file
                 # like http_huggingface_co.png
-                inputs = requests.get(inputs).content
+                response = requests.get(inputs, stream=True)
+                # `raw` exposes the transport bytes: ask urllib3 to undo any
+                # Content-Encoding (gzip/deflate) before they reach ffmpeg.
+                response.raw.decode_content = True
+                inputs = ffmpeg_read_streaming(response.raw, self.feature_extractor.sampling_rate)
             else:
                 with open(inputs, "rb") as f:
-                    inputs = f.read()
+                    inputs = ffmpeg_read_streaming(f, self.feature_extractor.sampling_rate)
 
         if isinstance(inputs, bytes):
             inputs = ffmpeg_read(inputs, self.feature_extractor.sampling_rate)
@@ -319,11 +591,25 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
             inputs = _inputs
             if in_sampling_rate != self.feature_extractor.sampling_rate:
                 import torch
-                from torchaudio import functional as F
+                from torchaudio import transforms
 
-                inputs = F.resample(
-                    torch.from_numpy(inputs), in_sampling_rate, self.feature_extractor.sampling_rate
-                ).numpy()
+                # `preprocess` can run inside a forked DataLoader worker
+                # (`num_workers=1` with dataset inputs), where initializing
+                # CUDA raises, so the GPU is only used from the main process.
+                if self.device.type == "cuda" and torch.utils.data.get_worker_info() is None:
+                    device = self.device
+                else:
+                    device = torch.device("cpu")
+                key = (in_sampling_rate, self.feature_extractor.sampling_rate, device.type)
+                resampler = self._resamplers.get(key)
+                if resampler is None:
+                    # The polyphase kernel only depends on the two frequencies,
+                    # build it once per device. Kept in float32 so the kernel
+                    # is not recomputed for dtype changes.
+                    resampler = transforms.Resample(*key[:2]).to(device)
+                    self._resamplers[key] = resampler
+                waveform = torch.as_tensor(inputs, dtype=torch.float32, device=device)
+                inputs = resampler(waveform).cpu().numpy()
                 ratio = self.feature_extractor.sampling_rate / in_sampling_rate
             else:
                 ratio = 1
@@ -368,9 +654,21 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
                 raise ValueError("Chunk length must be superior to stride length")
 
             # make sure that
-            for item in chunk_iter(
-                inputs, self.feature_extractor, chunk_len, stride_left, stride_right, self.torch_dtype
-            ):
+            chunks = chunk_iter(
+                inputs,
+                self.feature_extractor,
+                chunk_len,
+                stride_left,
+                stride_right,
+                self.torch_dtype,
+                # Pinning only pays off when the features actually go to a GPU.
+                pin_memory=self.device.type == "cuda",
+            )
+            if preprocess_prefetch:
+                # Extract the features of chunk `i + 1` in a background thread
+                # while the model forward runs on chunk `i`.
+                chunks = _prefetch_iterator(chunks)
+            for item in chunks:
                 yield item
         else:
             processed = self.feature_extractor(
@@ -428,21 +726,64 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
             if self.type == "ctc_with_lm":
                 out = {"logits": logits}
             else:
-                out = {"tokens": logits.argmax(dim=-1)}
+                # Token ids easily fit in int32, halving the bytes moved back
+                # to CPU compared to argmax's int64 output.
+                out = {"tokens": logits.argmax(dim=-1).to(torch.int32)}
             if stride is not None:
                 # Send stride to `postprocess`.
                 # it needs to be handled there where
                 # the pieces are to be concatenated.
-                ratio = 1 / self.model.config.inputs_to_logits_ratio
-                if isinstance(stride, tuple):
+                ratio = 1 / (getattr(self.model.config, "inputs_to_logits_ratio", None) or 1)
+                if ratio == 1.0:
+                    # Tokens/logits space is the input space, the stride can be
+                    # reused as is.
+                    out["stride"] = stride
+                elif isinstance(stride, tuple):
                     out["stride"] = rescale_stride([stride], ratio)[0]
                 else:
                     out["stride"] = rescale_stride(stride, ratio)
+                if isinstance(out["stride"], tuple):
+                    # Crop the strided regions while still on the device, so
+                    # only the kept frames are copied back to CPU by
+                    # `Pipeline.forward`. `postprocess` sees an already
+                    # stripped chunk with a no-op stride.
+                    key = "logits" if self.type == "ctc_with_lm" else "tokens"
+                    total_n, left, right = out["stride"]
+                    right_n = total_n - right
+                    if left != 0 or right_n < out[key].shape[1]:
+                        out[key] = out[key][:, left:right_n]
+                    out["stride"] = (out[key].shape[1], 0, 0)
         # Leftover
         extra = model_inputs
         return {"is_last": is_last, **out, **extra}
 
-    def postprocess(self, model_outputs, decoder_kwargs: Optional[Dict] = None, return_timestamps=None):
+    def _get_decode_pool(self, num_workers):
+        num_workers = min(num_workers, os.cpu_count() or 1)
+        if self._decode_pool is not None and self._decode_pool_size != num_workers:
+            self._decode_pool.close()
+            self._decode_pool.join()
+            self._decode_pool = None
+        if self._decode_pool is None:
+            # fork so that the workers inherit the decoder (and its LM)
+            # without pickling it.
+            self._decode_pool = multiprocessing.get_context("fork").Pool(num_workers)
+            self._decode_pool_size = num_workers
+        return self._decode_pool
+
+    def __del__(self):
+        pool = getattr(self, "_decode_pool", None)
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def postprocess(
+        self,
+        model_outputs,
+        decoder_kwargs: Optional[Dict] = None,
+        return_timestamps=None,
+        stream=False,
+        num_decode_workers=None,
+    ):
         # Optional return types
         optional = {}
 
@@ -450,39 +791,112 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
             raise ValueError("We cannot return_timestamps yet on non-ctc models !")
         if return_timestamps == "char" and self.type == "ctc_with_lm":
             raise ValueError("CTC with LM cannot return `char` timestamps, only `words`")
+        if stream:
+            # Single audios are streamed from `run_single` before the forward
+            # outputs are ever collected into a list, so reaching here means
+            # the pipeline was called on a dataset or list of audios.
+            raise ValueError("`stream=True` is only available when transcribing a single audio input")
 
-        final_items = []
         key = "logits" if self.type == "ctc_with_lm" else "tokens"
         stride = None
-        for outputs in model_outputs:
-            items = outputs[key].numpy()
-            stride = outputs.pop("stride", None)
-            if stride is not None and self.type in {"ctc", "ctc_with_lm"}:
-                total_n, left, right = stride
-                # Total_n might be < logits.shape[1]
-                # because of padding, that's why
-                # we need to reconstruct this information
-                # This won't work with left padding (which doesn't exist right now)
-                right_n = total_n - right
-                items = items[:, left:right_n]
-            final_items.append(items)
-        if stride and self.type == "seq2seq":
-            items = _find_longest_common_sequence(final_items, self.tokenizer)
+        # `extra` (any leftover keys) is collected while the outputs are
+        # consumed below, `model_outputs` is only traversed once.
+        extra = defaultdict(list)
+        if self.type == "seq2seq":
+            final_items = []
+            strides = []
+            for outputs in model_outputs:
+                final_items.append(outputs.pop(key).numpy())
+                stride = outputs.pop("stride", None)
+                strides.append(stride)
+                outputs.pop("is_last", None)
+                for k, v in outputs.items():
+                    extra[k].append(v)
+            if stride:
+                items = _find_longest_common_sequence(
+                    final_items, self.tokenizer, self._all_special_ids, self._lcs_buffers, strides
+                )
+            else:
+                items = np.concatenate(final_items, axis=1)
+                items = items.squeeze(0)
         else:
-            items = np.concatenate(final_items, axis=1)
+            # First pass: strip the strides and measure the kept regions, so
+            # the stitched result can be written once into a preallocated
+            # buffer instead of slice + np.concatenate copying everything
+            # twice (`items` can be [1, frames, vocab] logits).
+            cropped = []
+            total_len = 0
+            for outputs in model_outputs:
+                items = outputs.pop(key)
+                stride = outputs.pop("stride", None)
+                if stride is not None:
+                    total_n, left, right = stride
+                    # Total_n might be < logits.shape[1]
+                    # because of padding, that's why
+                    # we need to reconstruct this information
+                    # This won't work with left padding (which doesn't exist right now)
+                    right_n = total_n - right
+                    items = items[:, left:right_n]
+                cropped.append(items)
+                total_len += items.shape[1]
+                outputs.pop("is_last", None)
+                for k, v in outputs.items():
+                    extra[k].append(v)
+            # Second pass: each kept region is copied straight into its final
+            # offset in the destination buffer.
+            items = None
+            pos = 0
+            chunk_bounds = []
+            for tensor in cropped:
+                chunk = tensor.numpy()
+                if items is None:
+                    items = np.empty((chunk.shape[0], total_len) + chunk.shape[2:], dtype=chunk.dtype)
+                items[:, pos : pos + chunk.shape[1]] = chunk
+                chunk_bounds.append((pos, pos + chunk.shape[1]))
+                pos += chunk.shape[1]
             items = items.squeeze(0)
         if self.type == "ctc_with_lm":
             if decoder_kwargs is None:
                 decoder_kwargs = {}
-            beams = self.decoder.decode_beams(items, **decoder_kwargs)
-            text = beams[0][0]
-            if return_timestamps:
-                # Simply cast from pyctcdecode format to wav2vec2 format to leverage
-                # pre-existing code later
-                chunk_offset = beams[0][2]
-                word_offsets = []
-                for word, (start_offset, end_offset) in chunk_offset:
-                    word_offsets.append({"word": word, "start_offset": start_offset, "end_offset": end_offset})
+            use_pool = num_decode_workers is not None and num_decode_workers > 1 and len(chunk_bounds) > 1
+            if use_pool and not (
+                "fork" in multiprocessing.get_all_start_methods() and hasattr(self.decoder, "decode_beams_batch")
+            ):
+                logger.warning(
+                    "`num_decode_workers` requires the `fork` start method and a pyctcdecode version providing"
+                    " `decode_beams_batch`, falling back to single-process decoding"
+                )
+                use_pool = False
+            if use_pool:
+                # The LM beam search is CPU-bound Python, so the chunks are
+                # decoded in parallel; the stride cropping above already made
+                # them disjoint, the per-chunk texts just get joined. This is
+                # opt-in: the LM cannot see across chunk boundaries, so the
+                # text can differ slightly from the single-pass decoding. The
+                # mp-safe beams do not carry the LM state, their layout is
+                # (text, text_frames, logit_score, lm_score).
+                logits_list = [items[start:stop] for start, stop in chunk_bounds]
+                beams_list = self.decoder.decode_beams_batch(
+                    self._get_decode_pool(num_decode_workers), logits_list, **decoder_kwargs
+                )
+                text = " ".join(beams[0][0] for beams in beams_list if beams[0][0])
+                if return_timestamps:
+                    word_offsets = []
+                    for (start, _), beams in zip(chunk_bounds, beams_list):
+                        for word, (start_offset, end_offset) in beams[0][1]:
+                            word_offsets.append(
+                                {"word": word, "start_offset": start_offset + start, "end_offset": end_offset + start}
+                            )
+            else:
+                beams = self.decoder.decode_beams(items, **decoder_kwargs)
+                text = beams[0][0]
+                if return_timestamps:
+                    # Simply cast from pyctcdecode format to wav2vec2 format to leverage
+                    # pre-existing code later
+                    chunk_offset = beams[0][2]
+                    word_offsets = []
+                    for word, (start_offset, end_offset) in chunk_offset:
+                        word_offsets.append({"word": word, "start_offset": start_offset, "end_offset": end_offset})
 
         else:
             skip_special_tokens = self.type != "ctc"
@@ -502,21 +916,64 @@ class AutomaticSpeechRecognitionPipeline(ChunkPipeline):
             else:
                 offsets = char_offsets
             chunks = []
+            # hoisted out of the loop, the attribute lookups are not free on
+            # long timestamped transcriptions
+            offset_to_s = self.model.config.inputs_to_logits_ratio / self.feature_extractor.sampling_rate
             for item in offsets:
-                start = item["start_offset"] * self.model.config.inputs_to_logits_ratio
-                start /= self.feature_extractor.sampling_rate
-
-                stop = item["end_offset"] * self.model.config.inputs_to_logits_ratio
-                stop /= self.feature_extractor.sampling_rate
-
+                start = item["start_offset"] * offset_to_s
+                stop = item["end_offset"] * offset_to_s
                 chunks.append({"text": item[return_timestamps], "timestamp": (start, stop)})
             optional["chunks"] = chunks
 
+        return {"text": text, **optional, **extra}
+
+    def _postprocess_stream(self, model_outputs, return_timestamps):
+        """
+        Streaming variant of `postprocess` for pure CTC models. Consumes the forward outputs as they are produced and
+        yields a `{"partial_text": str}` dict as soon as each chunk is decoded, then the same final dict `postprocess`
+        would have returned. Each partial only decodes its own chunk (re-decoding the whole transcript on every chunk
+        would be quadratic), so repeated tokens sitting exactly on a chunk boundary can render slightly differently in
+        the partials than in the final text, which is decoded from the full token sequence.
+        """
+        pieces = []
+        texts = []
         extra = defaultdict(list)
-        for output in model_outputs:
-            output.pop("tokens", None)
-            output.pop("logits", None)
-            output.pop("is_last", None)
-            for k, v in output.items():
+        for outputs in model_outputs:
+            tokens = outputs.pop("tokens")
+            is_last = outputs.pop("is_last")
+            stride = outputs.pop("stride", None)
+            if stride is not None:
+                total_n, left, right = stride
+                # Total_n might be < logits.shape[1]
+                # because of padding, that's why
+                # we need to reconstruct this information
+                # This won't work with left padding (which doesn't exist right now)
+                right_n = total_n - right
+                tokens = tokens[:, left:right_n]
+            piece = tokens.numpy()
+            pieces.append(piece)
+            for k, v in outputs.items():
                 extra[k].append(v)
-        return {"text": text, **optional, **extra}
+            if not is_last:
+                texts.append(self.tokenizer.decode(piece[0], skip_special_tokens=False))
+                yield {"partial_text": "".join(texts)}
+
+        items = np.concatenate(pieces, axis=1).squeeze(0)
+        text = self.tokenizer.decode(items, skip_special_tokens=False)
+        optional = {}
+        if return_timestamps:
+            char_offsets = self.tokenizer.decode(items, skip_special_tokens=False, output_char_offsets=True)[
+                "char_offsets"
+            ]
+            if return_timestamps == "word":
+                offsets = self.tokenizer._get_word_offsets(char_offsets, self.tokenizer.replace_word_delimiter_char)
+            else:
+                offsets = char_offsets
+            chunks = []
+            offset_to_s = self.model.config.inputs_to_logits_ratio / self.feature_extractor.sampling_rate
+            for item in offsets:
+                start = item["start_offset"] * offset_to_s
+                stop = item["end_offset"] * offset_to_s
+                chunks.append({"text": item[return_timestamps], "timestamp": (start, stop)})
+            optional["chunks"] = chunks
+        yield {"text": text, **optional, **extra}
@@ -902,6 +902,9 @@ class Pipeline(_ScikitCompat):
         elif isinstance(inputs, torch.Tensor):
             if device == torch.device("cpu") and inputs.dtype in {torch.float16, torch.bfloat16}:
                 inputs = inputs.float()
+            if device.type == "cuda" and not inputs.is_cuda and inputs.is_pinned():
+                # Pinned CPU tensors can be sent to the GPU asynchronously.
+                return inputs.to(device, non_blocking=True)
             return inputs.to(device)
         else:
             return inputs
@@ -118,6 +118,7 @@ from .import_utils import (
     is_more_itertools_available,
     is_natten_available,
     is_ninja_available,
+    is_numba_available,
     is_onnx_available,
     is_pandas_available,
     is_phonemizer_available,
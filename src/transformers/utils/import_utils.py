@@ -234,6 +234,14 @@ except importlib_metadata.PackageNotFoundError:
     _torchaudio_available = False
 
 
+_numba_available = importlib.util.find_spec("numba") is not None
+try:
+    _numba_version = importlib_metadata.version("numba")
+    logger.debug(f"Successfully imported numba version {_numba_version}")
+except importlib_metadata.PackageNotFoundError:
+    _numba_available = False
+
+
 _phonemizer_available = importlib.util.find_spec("phonemizer") is not None
 try:
     _phonemizer_version = importlib_metadata.version("phonemizer")
@@ -696,6 +704,10 @@ def is_speech_available():
     return _torchaudio_available
 
 
+def is_numba_available():
+    return _numba_available
+
+
 def is_phonemizer_available():
     return _phonemizer_available
 
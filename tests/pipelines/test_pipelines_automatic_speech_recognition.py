@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import struct
+import tempfile
 import unittest
 
 import numpy as np
@@ -30,8 +33,13 @@ from transformers import (
     WhisperProcessor,
 )
 from transformers.pipelines import AutomaticSpeechRecognitionPipeline, pipeline
-from transformers.pipelines.audio_utils import chunk_bytes_iter
-from transformers.pipelines.automatic_speech_recognition import chunk_iter
+from transformers.pipelines.audio_utils import chunk_bytes_iter, ffmpeg_read, ffmpeg_read_streaming
+from transformers.pipelines.automatic_speech_recognition import (
+    _find_longest_common_sequence,
+    _prefetch_iterator,
+    chunk_iter,
+    rescale_stride,
+)
 from transformers.testing_utils import (
     is_torch_available,
     nested_simplify,
@@ -823,6 +831,74 @@ class AutomaticSpeechRecognitionPipelineTests(unittest.TestCase, metaclass=Pipel
         output = speech_recognizer({"raw": waveform, "stride": (1000, 8000), "sampling_rate": 16_000})
         self.assertEqual(output, {"text": "XB"})
 
+    @require_torch
+    def test_chunk_iterator_batched(self):
+        feature_extractor = AutoFeatureExtractor.from_pretrained("facebook/wav2vec2-base-960h")
+        inputs = torch.arange(2000).long() % 17
+
+        # Enough full chunks to span several batched extraction groups, the
+        # features must match a chunk-by-chunk extraction exactly.
+        outs = list(chunk_iter(inputs, feature_extractor, 100, 20, 10))
+        self.assertEqual(len(outs), 29)
+        self.assertEqual([o["is_last"] for o in outs], [False] * 28 + [True])
+        for out, start in zip(outs, range(0, 2000, 70)):
+            chunk = inputs[start : start + 100]
+            expected = feature_extractor(chunk, sampling_rate=feature_extractor.sampling_rate, return_tensors="pt")
+            self.assertEqual(nested_simplify(out["input_values"]), nested_simplify(expected["input_values"]))
+
+    def test_rescale_stride_batched(self):
+        # The vectorized path (more than 8 strides) must match the scalar one
+        strides = [(1000 + 7 * i, 100 + i, 200 + 3 * i) for i in range(20)]
+        ratio = 0.0317
+        expected = [rescale_stride([stride], ratio)[0] for stride in strides]
+        self.assertEqual(rescale_stride(strides, ratio), expected)
+
+    def test_find_longest_common_sequence_strides(self):
+        all_special_ids = np.array([0], dtype=np.int64)
+        sequences = [[[0, 2, 3, 4, 5, 6]], [[5, 6, 7, 8, 0]], [[7, 8, 9, 10]]]
+        merged = _find_longest_common_sequence(sequences, None, all_special_ids=all_special_ids)
+        self.assertEqual(merged.tolist(), [2, 3, 4, 5, 6, 7, 8, 9, 10])
+
+        # Bounding the overlap search with the chunk strides must not change
+        # the merge when the real overlap fits in the bound.
+        strides = [(100, 0, 20), (100, 20, 20), (100, 20, 0)]
+        bounded = _find_longest_common_sequence(sequences, None, all_special_ids=all_special_ids, strides=strides)
+        self.assertEqual(bounded.tolist(), merged.tolist())
+
+    def test_prefetch_iterator(self):
+        self.assertEqual(list(_prefetch_iterator(iter(range(10)))), list(range(10)))
+
+        def failing_iterator():
+            yield 0
+            yield 1
+            raise ValueError("failure in the producer thread")
+
+        iterator = _prefetch_iterator(failing_iterator())
+        self.assertEqual(next(iterator), 0)
+        self.assertEqual(next(iterator), 1)
+        with self.assertRaises(ValueError):
+            next(iterator)
+
+    @require_torch
+    def test_stream(self):
+        speech_recognizer = pipeline(
+            task="automatic-speech-recognition",
+            model="hf-internal-testing/tiny-random-wav2vec2",
+        )
+        waveform = np.tile(np.arange(1000, dtype=np.float32), 32)
+
+        expected = speech_recognizer(waveform, chunk_length_s=0.5)
+        outputs = list(speech_recognizer(waveform, chunk_length_s=0.5, stream=True))
+        self.assertGreater(len(outputs), 1)
+        for partial in outputs[:-1]:
+            self.assertEqual(partial, {"partial_text": ANY(str)})
+        # The final item is the same dict the non-streaming call returns
+        self.assertEqual(outputs[-1], expected)
+
+        # Streaming is only defined for a single audio
+        with self.assertRaises(ValueError):
+            speech_recognizer([waveform], chunk_length_s=0.5, stream=True)
+
 
 def require_ffmpeg(test_case):
     """
@@ -847,6 +923,44 @@ def bytes_iter(chunk_size, chunks):
 
 @require_ffmpeg
 class AudioUtilsTest(unittest.TestCase):
+    def _wav_bytes(self, n_samples, sampling_rate=16_000):
+        # Minimal mono 16-bit PCM WAV payload, no external files needed
+        data = (np.sin(np.arange(n_samples) / 100) * 32000).astype("<i2").tobytes()
+        header = b"RIFF" + struct.pack("<I", 36 + len(data)) + b"WAVE"
+        header += b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, sampling_rate, sampling_rate * 2, 2, 16)
+        header += b"data" + struct.pack("<I", len(data))
+        return header + data
+
+    def test_ffmpeg_read_streaming_filelike(self):
+        # File-like objects without a file descriptor go through the feeder
+        # thread, the decoded audio must match the buffered reader.
+        payload = self._wav_bytes(8000)
+        audio = ffmpeg_read_streaming(io.BytesIO(payload), 16_000)
+        expected = ffmpeg_read(payload, 16_000)
+        self.assertTrue(np.array_equal(audio, expected))
+
+    def test_ffmpeg_read_streaming_real_file(self):
+        # Real files are handed to ffmpeg directly through their descriptor
+        payload = self._wav_bytes(8000)
+        with tempfile.NamedTemporaryFile(suffix=".wav") as f:
+            f.write(payload)
+            f.flush()
+            with open(f.name, "rb") as stream:
+                audio = ffmpeg_read_streaming(stream, 16_000)
+        expected = ffmpeg_read(payload, 16_000)
+        self.assertTrue(np.array_equal(audio, expected))
+
+    def test_ffmpeg_read_streaming_long_audio(self):
+        # Longer than the initial one-second buffer, exercises the growth loop
+        payload = self._wav_bytes(100_000)
+        audio = ffmpeg_read_streaming(io.BytesIO(payload), 16_000)
+        expected = ffmpeg_read(payload, 16_000)
+        self.assertTrue(np.array_equal(audio, expected))
+
+    def test_ffmpeg_read_streaming_malformed(self):
+        with self.assertRaises(ValueError):
+            ffmpeg_read_streaming(io.BytesIO(b"this is not audio"), 16_000)
+
     def test_chunk_bytes_iter_too_big(self):
         iter_ = iter(chunk_bytes_iter(bytes_iter(chunk_size=3, chunks=2), 10, stride=(0, 0)))
         self.assertEqual(next(iter_), {"raw": b"\x00\x01\x02\x03\x04\x05", "stride": (0, 0)})